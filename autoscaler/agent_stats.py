@@ -1,4 +1,5 @@
 import logging
+import threading
 
 
 class AgentStats:
@@ -7,10 +8,62 @@ class AgentStats:
         self.stats = {}
         self.log = logging.getLogger("autoscale")
 
+        # Task statistics memoized by (agent, task, n) until reset()
+        self._cache = {}
+
+        # Guards creation of the per-agent locks below, which serialize
+        # snapshot fetches for the same agent across worker threads.
+        # reset() prunes the locks that are not held by a fetch
+        self._lock = threading.Lock()
+        self._agent_locks = {}
+
     def reset(self):
-        """ Drop all cached statistics.
+        """ Drop all cached statistics. The dictionaries are cleared
+        in place so their storage is reused across cycles.
         """
-        self.stats = {}
+        self.stats.clear()
+        self._cache.clear()
+        with self._lock:
+            for agent, lock in list(self._agent_locks.items()):
+                if not lock.locked():
+                    del self._agent_locks[agent]
+
+    def _agent_lock(self, agent):
+        with self._lock:
+            return self._agent_locks.setdefault(agent, threading.Lock())
+
+    def get_agent_stats(self, agent, n=0):
+        """ Get the performance metrics of all tasks running on the
+        specified agent. If the n'th snapshot is cached, it is returned,
+        otherwise a single request to the agent is made.
+        Safe to call concurrently; each agent's snapshot is fetched once.
+        Args:
+            agent: agent to query
+            n: statistics snapshot index
+        Returns:
+            dictionary of executor id mapped to its statistics snapshot
+        """
+
+        with self._agent_lock(agent):
+            agent_stats = self.stats.get(agent, [])
+            assert len(agent_stats) >= n, \
+                'n must be one of indexes of snapshots fetched previosly or be ' + \
+                'greater by one to fetch a new snapshot'
+
+            if len(agent_stats) > n:
+                return agent_stats[n]
+
+            snapshot = self.api_client.dcos_rest(
+                "get",
+                '/slave/' + agent + '/monitor/statistics'
+            )
+            executor_stats = {
+                i['executor_id']: i['statistics'] for i in snapshot
+            }
+            agent_stats.append(executor_stats)
+            self.stats[agent] = agent_stats
+
+        return executor_stats
 
     def get_task_stats(self, agent, task, n=0):
         """ Get the performance metrics of the given task running on
@@ -23,26 +76,14 @@ class AgentStats:
         Returns:
             statistics snapshot for the specific task running on the agent
         """
+        key = (agent, task, n)
+        if key in self._cache:
+            return self._cache[key]
 
-        agent_stats = self.stats.get(agent, [])
-        assert len(agent_stats) >= n, \
-            'n must be one of indexes of snapshots fetched previosly or be ' + \
-            'greater by one to fetch a new snapshot'
-
-        if len(agent_stats) > n:
-            snapshot = agent_stats[n]
-        else:
-            snapshot = self.api_client.dcos_rest(
-                "get",
-                '/slave/' + agent + '/monitor/statistics'
-            )
-            agent_stats.append(snapshot)
-            self.stats[agent] = agent_stats
+        task_stats = self.get_agent_stats(agent, n).get(task)
+        if task_stats is not None:
+            self.log.debug("stats for task %s agent %s: %s",
+                           task, agent, task_stats)
 
-        for i in snapshot:
-            executor_id = i['executor_id']
-            if executor_id == task:
-                task_stats = i['statistics']
-                self.log.debug("stats for task %s agent %s: %s",
-                               executor_id, agent, task_stats)
-                return task_stats
+        self._cache[key] = task_stats
+        return task_stats
@@ -5,20 +5,75 @@ import jwt
 import sys
 import logging
 import time
+import socket
+import threading
+import warnings
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTP adapter enabling TCP keepalive on pooled connections so that
+    idle connections to DC/OS survive, or fail fast, between cycles
+    """
+
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ]
+    # Probe timings are not available on every platform
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        SOCKET_OPTIONS += [
+            (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30),
+            (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10),
+            (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+        ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', self.SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
 
 
 class APIClient:
 
     DCOS_CA = 'dcos-ca.crt'
 
-    def __init__(self, dcos_master):
+    def __init__(self, dcos_master, session=None):
         self.dcos_master = dcos_master
         self.dcos_headers = {
             'User-Agent': 'marathon-autoscale',
             'Content-type': 'application/json'
         }
-        self.authenticate()
+        # Reuse a single session so connections are kept alive across
+        # cycles; a caller-provided session is used as is
+        self.session = session if session is not None else self.create_session()
+        # DC/OS endpoints are queried without certificate verification;
+        # silence only the warnings urllib3 raises for that
+        self.session.verify = False
+        warnings.filterwarnings('ignore', category=InsecureRequestWarning,
+                                module='urllib3')
         self.log = logging.getLogger("autoscale")
+        # Serializes token renewal between concurrent requests
+        self._auth_lock = threading.Lock()
+        self.authenticate()
+
+    @staticmethod
+    def create_session():
+        """Create the default pooled session with TCP keepalive enabled
+        Returns:
+            requests.Session with a KeepAliveAdapter mounted for http and https
+        """
+        session = requests.Session()
+        adapter = KeepAliveAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
 
     def authenticate(self):
         """Using a userid/pass or a service account secret,
@@ -30,7 +85,7 @@ class APIClient:
         # Get the cert authority
         if not os.path.isfile(self.DCOS_CA):
 
-            response = requests.get(
+            response = self.session.get(
                 self.dcos_master + '/ca/dcos-ca.crt',
                 headers=self.dcos_headers,
                 verify=False
@@ -70,7 +125,7 @@ class APIClient:
             return
 
         # Create or renew auth token for the service account
-        response = requests.post(
+        response = self.session.post(
             self.dcos_master + "/acs/api/v1/auth/login",
             headers=self.dcos_headers,
             data=auth_data,
@@ -83,9 +138,22 @@ class APIClient:
             self.log.error("Unable to authenticate or renew JWT token: %s", result)
             sys.exit(1)
 
-        self.dcos_headers.update({
-            'Authorization': 'token=' + result['token']
-        })
+        # Rebind rather than update so that concurrent requests always
+        # send a complete set of headers
+        headers = dict(self.dcos_headers)
+        headers['Authorization'] = 'token=' + result['token']
+        self.dcos_headers = headers
+
+    def reauthenticate(self, stale_headers):
+        """Renew the auth token after a 401, unless another thread has
+        already renewed it since the failed request was sent
+        Args:
+            stale_headers (dict): headers sent with the rejected request
+        """
+        with self._auth_lock:
+            if self.dcos_headers is stale_headers:
+                self.log.info("Token expired. Re-authenticating to DC/OS")
+                self.authenticate()
 
     def dcos_rest(self, method, path, data=None, auth=True):
         """Common querying procedure that handles 401 errors
@@ -95,19 +163,20 @@ class APIClient:
         Returns:
             JSON requests.response.content result of the query
         """
+        headers = self.dcos_headers
         try:
             if data is None:
-                response = requests.request(
+                response = self.session.request(
                     method,
                     self.dcos_master + path,
-                    headers=self.dcos_headers,
+                    headers=headers,
                     verify=False
                 )
             else:
-                response = requests.request(
+                response = self.session.request(
                     method,
                     self.dcos_master + path,
-                    headers=self.dcos_headers,
+                    headers=headers,
                     data=data,
                     verify=False
                 )
@@ -116,8 +185,7 @@ class APIClient:
 
             if response.status_code != 200:
                 if response.status_code == 401 and auth:
-                    self.log.info("Token expired. Re-authenticating to DC/OS")
-                    self.authenticate()
+                    self.reauthenticate(headers)
                     return self.dcos_rest(method, path, data=data, auth=False)
                 else:
                     response.raise_for_status()
@@ -1,9 +1,21 @@
 from abc import ABC, abstractmethod
 import logging
 
+LOG = logging.getLogger("autoscale")
+
+
+def _first(value):
+    """Unbox a threshold given either as a scalar or as a sequence,
+    in which case its first element is used
+    """
+    return value[0] if isinstance(value, (list, tuple)) else value
+
 
 class AbstractMode(ABC):
 
+    __slots__ = ('api_client', 'agent_stats', 'app', 'min_range',
+                 'max_range')
+
     def __init__(self, api_client=None, agent_stats=None, app=None,
                  dimension=None):
 
@@ -15,18 +27,12 @@ class AbstractMode(ABC):
         self.min_range = 0.0
         self.max_range = 100.0
 
+        # Combined modes receive one threshold per sub-mode, e.g.
+        # {"min": [cpu_min, mem_min]}, and must pass each sub-mode
+        # its own scalar rather than rely on this unboxing
         if dimension is not None:
-            if isinstance(dimension["min"], list):
-                self.min_range = dimension["min"][0]
-            else:
-                self.min_range = dimension["min"]
-
-            if isinstance(dimension["max"], list):
-                self.max_range = dimension["max"][0]
-            else:
-                self.max_range = dimension["max"]
-
-        self.log = logging.getLogger("autoscale")
+            self.min_range = _first(dimension["min"])
+            self.max_range = _first(dimension["max"])
 
     @abstractmethod
     def scale_direction(self, value):
@@ -35,15 +41,11 @@ class AbstractMode(ABC):
         is below (-1), within (0), or above (1) the threshold of
         the scaling mode.
         """
-        if value > self.max_range:
-            self.log.debug("Scaling mode above max threshold of %s"
-                           % self.max_range)
-            return 1
-        elif value < self.min_range:
-            self.log.debug("Scaling mode below min threshold of %s"
-                           % self.min_range)
-            return -1
-        else:
-            self.log.debug("Scaling mode within thresholds (min=%s, max=%s)"
-                           % (self.min_range, self.max_range))
-            return 0
+        direction = (value > self.max_range) - (value < self.min_range)
+
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Scaling mode value %s against thresholds "
+                      "(min=%s, max=%s), direction = %s",
+                      value, self.min_range, self.max_range, direction)
+
+        return direction
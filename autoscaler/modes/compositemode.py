@@ -0,0 +1,62 @@
+import sys
+import logging
+from abc import abstractmethod
+
+from autoscaler.modes.abstractmode import AbstractMode
+
+LOG = logging.getLogger("autoscale")
+
+
+class CompositeMode(AbstractMode):
+    """Scaling mode that combines the directions of several sub-modes.
+    The sub-modes share the composite's agent_stats, so statistics
+    snapshots fetched by one are reused by the others within a cycle.
+    """
+
+    __slots__ = ('mode_map',)
+
+    # Name used in configuration error messages
+    NAME = None
+
+    # Ordered (name, mode class) pairs, one per comma-delimited value
+    # of MIN_RANGE and MAX_RANGE
+    SUB_MODES = ()
+
+    def __init__(self, api_client=None, agent_stats=None, app=None,
+                 dimension=None):
+        super().__init__(api_client, agent_stats, app)
+
+        count = len(self.SUB_MODES)
+        if len(dimension['min']) < count or len(dimension['max']) < count:
+            LOG.error("Scale mode %s requires %s comma-delimited "
+                      "values for MIN_RANGE and MAX_RANGE.",
+                      self.NAME, count)
+            sys.exit(1)
+
+        # Instantiate the sub-mode classes
+        self.mode_map = {}
+        for idx, (name, mode) in enumerate(self.SUB_MODES):
+            self.mode_map[name] = mode(
+                api_client=self.api_client,
+                app=self.app,
+                agent_stats=self.agent_stats,
+                dimension={
+                    'min': dimension['min'][idx],
+                    'max': dimension['max'][idx]
+                }
+            )
+
+    @abstractmethod
+    def reduce(self, results):
+        """
+        Combine the sub-mode directions, in SUB_MODES order,
+        into a single direction.
+        """
+
+    def scale_direction(self):
+        results = [mode.scale_direction() for mode in self.mode_map.values()]
+
+        for name, result in zip(self.mode_map, results):
+            LOG.info("%s direction = %s", name, result)
+
+        return self.reduce(results)
@@ -1,10 +1,15 @@
 import time
+import logging
 
 from autoscaler.modes.abstractmode import AbstractMode
 
+LOG = logging.getLogger("autoscale")
+
 
 class ScaleByCPU(AbstractMode):
 
+    __slots__ = ()
+
     def __init__(self, api_client=None, agent_stats=None, app=None,
                  dimension=None):
         super().__init__(api_client, agent_stats, app, dimension)
@@ -24,7 +29,7 @@ class ScaleByCPU(AbstractMode):
         try:
 
             for task, agent in app_task_dict.items():
-                self.log.info("Inspecting task %s on agent %s", task, agent)
+                LOG.info("Inspecting task %s on agent %s", task, agent)
 
                 # CPU usage
                 cpu_usage = self.get_cpu_usage(task, agent)
@@ -35,8 +40,8 @@ class ScaleByCPU(AbstractMode):
 
         # Normalized data for all tasks into a single value by averaging
         value = (sum(app_cpu_values) / len(app_cpu_values))
-        self.log.info("Current average CPU time for app %s = %s",
-                      self.app.app_name, value)
+        LOG.info("Current average CPU time for app %s = %s",
+                 self.app.app_name, value)
 
         return value
 
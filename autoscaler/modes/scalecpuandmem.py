@@ -1,49 +1,20 @@
-import sys
-
-from autoscaler.modes.abstractmode import AbstractMode
+from autoscaler.modes.compositemode import CompositeMode
 from autoscaler.modes.scalecpu import ScaleByCPU
 from autoscaler.modes.scalemem import ScaleByMemory
 
 
-class ScaleByCPUAndMemory(AbstractMode):
-
-    def __init__(self,  api_client=None, agent_stats=None, app=None,
-                 dimension=None):
-        super().__init__(api_client, agent_stats, app)
-        self.mode_map = {'cpu': ScaleByCPU, 'mem': ScaleByMemory}
+class ScaleByCPUAndMemory(CompositeMode):
 
-        if len(dimension['min']) < 2 or len(dimension['max']) < 2:
-            self.log.error("Scale mode AND requires two comma-delimited "
-                           "values for MIN_RANGE and MAX_RANGE.")
-            sys.exit(1)
+    __slots__ = ()
 
-        # Instantiate the CPU/Memory mode classes
-        for idx, mode in enumerate(list(self.mode_map.keys())):
-            self.mode_map[mode] = self.mode_map[mode](
-                api_client=self.api_client,
-                app=self.app,
-                agent_stats=self.agent_stats,
-                dimension={
-                    'min': dimension['min'][idx],
-                    'max': dimension['max'][idx]
-                }
-            )
+    NAME = 'AND'
+    SUB_MODES = (('CPU', ScaleByCPU), ('Memory', ScaleByMemory))
 
-    def scale_direction(self):
+    def reduce(self, results):
         """
         Test CPU (x) and Memory (y) direction for equality.
         If (x = y), return x, otherwise return 0.
         """
-        results = []
-
-        try:
-            for mode in list(self.mode_map.keys()):
-                results.append(self.mode_map[mode].scale_direction())
-        except ValueError:
-            raise
-
-        self.log.info("CPU direction = %s, Memory direction = %s",
-                      results[0], results[1])
         if results[0] == results[1]:
             return results[0]
         else:
@@ -1,12 +1,25 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+
 from autoscaler.modes.abstractmode import AbstractMode
 
+LOG = logging.getLogger("autoscale")
+
 
 class ScaleByMemory(AbstractMode):
 
+    __slots__ = ('pool',)
+
+    # Upper bound on concurrent requests to the agents
+    MAX_WORKERS = 32
+
     def __init__(self, api_client=None, agent_stats=None, app=None,
                  dimension=None):
         super().__init__(api_client, agent_stats, app, dimension)
 
+        # Worker threads are reused across cycles
+        self.pool = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+
     def get_value(self):
 
         app_mem_values = []
@@ -18,54 +31,75 @@ class ScaleByMemory(AbstractMode):
         if not app_task_dict:
             raise ValueError("No marathon app task data found for app %s" % self.app.app_name)
 
-        try:
-
-            for task, agent in app_task_dict.items():
-                self.log.info("Inspecting task %s on agent %s",
-                              task, agent)
-
-                # Memory usage
+        # Group tasks by agent so each agent is queried only once
+        agent_tasks = {}
+        for task, agent in app_task_dict.items():
+            agent_tasks.setdefault(agent, []).append(task)
+
+        # Fetch the statistics of all agents concurrently. Every fetch
+        # must finish before an error is raised, otherwise a straggler
+        # could store its snapshot after the next cycle's reset()
+        futures = [
+            self.pool.submit(self.agent_stats.get_agent_stats, agent)
+            for agent in agent_tasks
+        ]
+        wait(futures)
+        for future in futures:
+            future.result()
+
+        # Number of tasks the agents reported statistics for
+        reported_tasks = 0
+
+        for agent, tasks in agent_tasks.items():
+            for task in tasks:
+                LOG.info("Inspecting task %s on agent %s", task, agent)
+
+                # Memory usage, counted as 0% for tasks without statistics
                 mem_utilization = self.get_mem_usage(task, agent)
+                if mem_utilization is None:
+                    mem_utilization = 0
+                else:
+                    reported_tasks += 1
                 app_mem_values.append(mem_utilization)
 
-        except ValueError:
-            raise
+        # An average with no task reported would wrongly read as idle
+        if not reported_tasks:
+            raise ValueError("No memory statistics found for app %s" % self.app.app_name)
 
         # Normalized data for all tasks into a single value by averaging
         app_avg_mem = (sum(app_mem_values) / len(app_mem_values))
-        self.log.info("Current average Memory utilization for app %s = %s",
-                      self.app.app_name, app_avg_mem)
+        LOG.info("Current average Memory utilization for app %s = %s",
+                 self.app.app_name, app_avg_mem)
 
         return app_avg_mem
 
     def scale_direction(self):
 
-        try:
-            value = self.get_value()
-            return super().scale_direction(value)
-        except ValueError:
-            raise
+        value = self.get_value()
+        return super().scale_direction(value)
 
     def get_mem_usage(self, task, agent):
         """Calculate memory usage for the task on the given agent
+        Returns:
+            memory utilization in percent, or None if the agent reported
+            no statistics for the task
         """
         task_stats = self.agent_stats.get_task_stats(agent, task)
 
-        # RAM usage
-        if task_stats is not None:
-            mem_rss_bytes = int(task_stats['mem_rss_bytes'])
-            mem_limit_bytes = int(task_stats['mem_limit_bytes'])
-            if mem_limit_bytes == 0:
-                raise ValueError("mem_limit_bytes for task {} agent {} is 0".format(task, agent))
+        if task_stats is None:
+            LOG.debug("task %s has no statistics on agent %s", task, agent)
+            return None
 
-            mem_utilization = 100 * (float(mem_rss_bytes) / float(mem_limit_bytes))
+        # RAM usage
+        mem_rss_bytes = task_stats['mem_rss_bytes']
+        mem_limit_bytes = task_stats['mem_limit_bytes']
+        if mem_limit_bytes == 0:
+            raise ValueError("mem_limit_bytes for task {} agent {} is 0".format(task, agent))
 
-        else:
-            mem_rss_bytes = 0
-            mem_limit_bytes = 0
-            mem_utilization = 0
+        mem_utilization = 100.0 * mem_rss_bytes / mem_limit_bytes
 
-        self.log.debug("task %s mem_rss_bytes %s mem_utilization %s mem_limit_bytes %s",
-                       task, mem_rss_bytes, mem_utilization, mem_limit_bytes)
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("task %s mem_rss_bytes %s mem_utilization %s mem_limit_bytes %s",
+                      task, mem_rss_bytes, mem_utilization, mem_limit_bytes)
 
         return mem_utilization
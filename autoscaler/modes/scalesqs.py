@@ -7,9 +7,13 @@ from botocore.errorfactory import ClientError
 
 from autoscaler.modes.abstractmode import AbstractMode
 
+LOG = logging.getLogger("autoscale")
+
 
 class ScaleBySQS(AbstractMode):
 
+    __slots__ = ('sqs', 'url')
+
     def __init__(self, api_client=None, agent_stats=None, app=None,
                  dimension=None):
         super().__init__(api_client, agent_stats, app, dimension)
@@ -20,7 +24,7 @@ class ScaleBySQS(AbstractMode):
 
         # Verify environment vars for SQS config exist
         if 'AS_QUEUE_URL' not in os.environ.keys():
-            self.log.error("AS_QUEUE_URL env var is not set.")
+            LOG.error("AS_QUEUE_URL env var is not set.")
             sys.exit(1)
 
         """Boto3 will use the AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY,
@@ -45,7 +49,7 @@ class ScaleBySQS(AbstractMode):
         except ClientError as e:
             raise ValueError("Boto3 client error: %s", e.response)
 
-        self.log.info("Current available messages for queue is %s", value)
+        LOG.info("Current available messages for queue is %s", value)
 
         return value
 
@@ -1,11 +1,11 @@
 import logging
 import os
-import json
 import sys
 import time
-import math
 import argparse
-import urllib3
+import functools
+import math
+from fractions import Fraction
 
 from autoscaler.agent_stats import AgentStats
 from autoscaler.api_client import APIClient
@@ -16,8 +16,6 @@ from autoscaler.modes.scalemem import ScaleByMemory
 from autoscaler.modes.scalecpuandmem import ScaleByCPUAndMemory
 from autoscaler.modes.scalebycpuormem import ScaleByCPUOrMemory
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
 
 class Autoscaler:
     """Marathon autoscaler upon initialization, it reads a list of
@@ -29,6 +27,24 @@ class Autoscaler:
 
     LOGGING_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     MARATHON_APPS_URI = '/service/marathon/v2/apps'
+    # Upper bound in seconds on the back-off after consecutive failed cycles
+    MAX_BACKOFF = 300
+
+    # Required command line arguments and the environment variables
+    # supplying their defaults
+    ENV_ARGUMENTS = {
+        'dcos_master': 'AS_DCOS_MASTER',
+        'trigger_mode': 'AS_TRIGGER_MODE',
+        'autoscale_multiplier': 'AS_AUTOSCALE_MULTIPLIER',
+        'max_instances': 'AS_MAX_INSTANCES',
+        'marathon_app': 'AS_MARATHON_APP',
+        'min_instances': 'AS_MIN_INSTANCES',
+        'cool_down_factor': 'AS_COOL_DOWN_FACTOR',
+        'scale_up_factor': 'AS_SCALE_UP_FACTOR',
+        'interval': 'AS_INTERVAL',
+        'min_range': 'AS_MIN_RANGE',
+        'max_range': 'AS_MAX_RANGE'
+    }
 
     # Dictionary defines the different scaling modes available to autoscaler
     MODES = {
@@ -47,12 +63,12 @@ class Autoscaler:
 
         self.scale_up = 0
         self.cool_down = 0
+        self.miss_count = 0
 
         args = self.parse_arguments()
 
         self.dcos_master = args.dcos_master
         self.trigger_mode = args.trigger_mode
-        self.autoscale_multiplier = float(args.autoscale_multiplier)
         self.min_instances = int(args.min_instances)
         self.max_instances = int(args.max_instances)
         self.cool_down_factor = int(args.cool_down_factor)
@@ -73,6 +89,14 @@ class Autoscaler:
 
         self.log = logging.getLogger("autoscale")
 
+        # Multiplier as an exact fraction so scaling can use integer math
+        if not math.isfinite(args.autoscale_multiplier) or args.autoscale_multiplier <= 0:
+            self.log.error("AUTOSCALE_MULTIPLIER must be a finite number greater than 0.")
+            sys.exit(1)
+        multiplier = Fraction(str(args.autoscale_multiplier))
+        self.multiplier_num = multiplier.numerator
+        self.multiplier_den = multiplier.denominator
+
         # Initialize marathon client for auth requests
         self.api_client = APIClient(self.dcos_master)
 
@@ -87,16 +111,22 @@ class Autoscaler:
             app_name=app_name,
             api_client=self.api_client
         )
+        self.scale_uri = self.MARATHON_APPS_URI + self.marathon_app.app_name
 
         # Instantiate the scaling mode class
         if self.MODES.get(self.trigger_mode, None) is None:
             self.log.error("Scale mode is not found.")
             sys.exit(1)
 
-        min = [float(i) for i in args.min_range.split(',')]
-        max = [float(i) for i in args.max_range.split(',')]
+        min_range = tuple(map(float, args.min_range.split(',')))
+        max_range = tuple(map(float, args.max_range.split(',')))
 
-        dimension = {"min": min, "max": max}
+        if len(min_range) != len(max_range):
+            self.log.error("MIN_RANGE and MAX_RANGE must have the same "
+                           "number of comma-delimited values.")
+            sys.exit(1)
+
+        dimension = {"min": min_range, "max": max_range}
 
         self.scaling_mode = self.MODES[self.trigger_mode](
             api_client=self.api_client,
@@ -105,11 +135,33 @@ class Autoscaler:
             dimension=dimension,
         )
 
-    def timer(self):
-        """Simple timer function"""
-        self.log.debug("Successfully completed a cycle, sleeping for %s seconds",
-                       self.interval)
-        time.sleep(self.interval)
+    def timer(self, deadline):
+        """Sleep until the next cycle is due
+        Args:
+            deadline(float): time.monotonic() value at which the next cycle starts
+        Returns:
+            the deadline of the next cycle, rescheduled from now if overrun
+        """
+        sleep_for = deadline - time.monotonic()
+        if sleep_for > 0:
+            self.log.debug("Sleeping for %.2f seconds until the next cycle",
+                           sleep_for)
+            time.sleep(sleep_for)
+        else:
+            self.log.warning("Cycle overran by %.2f seconds", -sleep_for)
+            deadline = time.monotonic()
+        return deadline
+
+    def backoff(self):
+        """Delay before retrying after a failed cycle, doubling with
+        each consecutive failure up to MAX_BACKOFF (or the interval,
+        if that is longer)
+        """
+        max_backoff = max(self.MAX_BACKOFF, self.interval)
+        delay = min(self.interval * 2 ** self.miss_count, max_backoff)
+        if delay < max_backoff:
+            self.miss_count += 1
+        return delay
 
     def autoscale(self, direction):
         """ Determine if scaling mode direction is below or above scaling
@@ -121,26 +173,28 @@ class Autoscaler:
             self.scale_up += 1
             self.cool_down = 0
             if self.scale_up >= self.scale_up_factor:
-                self.log.info("Auto-scale triggered based on %s exceeding threshold" % self.trigger_mode)
+                self.log.info("Auto-scale triggered based on %s exceeding threshold",
+                              self.trigger_mode)
                 self.scale_app(True)
                 self.scale_up = 0
             else:
                 self.log.info("%s above thresholds, but waiting to exceed scale-up factor. "
-                              "Consecutive cycles = %s, Scale-up factor = %s" %
-                              (self.trigger_mode, self.scale_up, self.scale_up_factor))
+                              "Consecutive cycles = %s, Scale-up factor = %s",
+                              self.trigger_mode, self.scale_up, self.scale_up_factor)
         elif direction == -1:
             self.cool_down += 1
             self.scale_up = 0
             if self.cool_down >= self.cool_down_factor:
-                self.log.info("Auto-scale triggered based on %s below the threshold" % self.trigger_mode)
+                self.log.info("Auto-scale triggered based on %s below the threshold",
+                              self.trigger_mode)
                 self.scale_app(False)
                 self.cool_down = 0
             else:
                 self.log.info("%s below thresholds, but waiting to exceed cool-down factor. "
-                              "Consecutive cycles = %s, Cool-down factor = %s" %
-                              (self.trigger_mode, self.cool_down, self.cool_down_factor))
+                              "Consecutive cycles = %s, Cool-down factor = %s",
+                              self.trigger_mode, self.cool_down, self.cool_down_factor)
         else:
-            self.log.info("%s within thresholds" % self.trigger_mode)
+            self.log.info("%s within thresholds", self.trigger_mode)
             self.scale_up = 0
             self.cool_down = 0
 
@@ -153,12 +207,14 @@ class Autoscaler:
         app_instances = self.marathon_app.get_app_instances()
 
         if is_up:
-            target_instances = math.ceil(app_instances * self.autoscale_multiplier)
+            # ceil(app_instances * multiplier)
+            target_instances = -(-app_instances * self.multiplier_num // self.multiplier_den)
             if target_instances > self.max_instances:
                 self.log.info("Reached the set maximum of instances %s", self.max_instances)
                 target_instances = self.max_instances
         else:
-            target_instances = math.floor(app_instances / self.autoscale_multiplier)
+            # floor(app_instances / multiplier)
+            target_instances = app_instances * self.multiplier_den // self.multiplier_num
             if target_instances < self.min_instances:
                 self.log.info("Reached the set minimum of instances %s", self.min_instances)
                 target_instances = self.min_instances
@@ -167,95 +223,127 @@ class Autoscaler:
                        app_instances, target_instances)
 
         if app_instances != target_instances:
-            data = {'instances': target_instances}
-            json_data = json.dumps(data)
+            # A single integer field needs no JSON encoder
+            json_data = '{"instances": %d}' % target_instances
             response = self.api_client.dcos_rest(
                 "put",
-                '/service/marathon/v2/apps' + self.marathon_app.app_name,
+                self.scale_uri,
                 data=json_data
             )
             self.log.debug("scale_app response: %s", response)
 
-    def parse_arguments(self):
-        """Set up an argument parser
-        Override values of command line arguments with environment variables.
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _build_parser(cls):
+        """Set up an argument parser, built once per process. Only the
+        schema is cached; environment defaults are applied on every parse.
         """
         parser = argparse.ArgumentParser(description='Marathon autoscale_examples app.')
-        parser.set_defaults()
         parser.add_argument('--dcos-master',
                             help=('The DNS hostname or IP of your Marathon'
-                                  ' Instance'),
-                            **self.env_or_req('AS_DCOS_MASTER'))
+                                  ' Instance'))
         parser.add_argument('--trigger_mode',
                             help=('Which metric(s) to trigger Autoscale '
-                                  '(cpu, mem, sqs)'),
-                            **self.env_or_req('AS_TRIGGER_MODE'))
+                                  '(cpu, mem, sqs)'))
         parser.add_argument('--autoscale_multiplier',
                             help=('Autoscale multiplier for triggered '
                                   'Autoscale (ie 2)'),
-                            **self.env_or_req('AS_AUTOSCALE_MULTIPLIER'), type=float)
+                            type=float)
         parser.add_argument('--max_instances',
                             help=('The Max instances that should ever exist'
                                   ' for this application (ie. 20)'),
-                            **self.env_or_req('AS_MAX_INSTANCES'), type=int)
+                            type=int)
         parser.add_argument('--marathon-app',
                             help=('Marathon Application Name to Configure '
-                                  'Autoscale for from the Marathon UI'),
-                            **self.env_or_req('AS_MARATHON_APP'))
+                                  'Autoscale for from the Marathon UI'))
         parser.add_argument('--min_instances',
                             help='Minimum number of instances to maintain',
-                            **self.env_or_req('AS_MIN_INSTANCES'), type=int)
+                            type=int)
         parser.add_argument('--cool_down_factor',
                             help='Number of cycles to avoid scaling again',
-                            **self.env_or_req('AS_COOL_DOWN_FACTOR'), type=int)
+                            type=int)
         parser.add_argument('--scale_up_factor',
                             help='Number of cycles to avoid scaling again',
-                            **self.env_or_req('AS_SCALE_UP_FACTOR'), type=int)
+                            type=int)
         parser.add_argument('--interval',
                             help=('Time in seconds to wait between '
                                   'checks (ie. 20)'),
-                            **self.env_or_req('AS_INTERVAL'), type=int)
+                            type=int)
         parser.add_argument('--min_range',
                             help=('The minimum range of the scaling modes '
                                   'dimension.'),
-                            **self.env_or_req('AS_MIN_RANGE'), type=str)
+                            type=str)
         parser.add_argument('--max_range',
                             help=('The maximum range of the scaling modes '
                                   'dimension'),
-                            **self.env_or_req('AS_MAX_RANGE'), type=str)
+                            type=str)
         parser.add_argument('-v', '--verbose', action="store_true",
                             help='Display DEBUG messages')
 
+        # Flag the arguments that must come from the command line or
+        # their environment variable
+        for action in parser._actions:
+            key = cls.ENV_ARGUMENTS.get(action.dest)
+            if key is not None:
+                action.help += ' (required unless %s is set)' % key
+        return parser
+
+    def parse_arguments(self):
+        """Parse command line arguments
+        Override values of command line arguments with environment variables.
+        """
+        parser = self._build_parser()
+
+        # Refresh every environment default, including unset ones, so that
+        # values from a previous call do not linger on the cached parser
+        parser.set_defaults(**{
+            dest: self.env_or_none(key)
+            for dest, key in self.ENV_ARGUMENTS.items()
+        })
+
         try:
             args = parser.parse_args()
-            return args
         except argparse.ArgumentError as arg_err:
             sys.stderr.write(arg_err)
             parser.print_help()
             sys.exit(1)
 
+        missing = [
+            '/'.join(action.option_strings + [self.ENV_ARGUMENTS[action.dest]])
+            for action in parser._actions
+            if action.dest in self.ENV_ARGUMENTS and getattr(args, action.dest) is None
+        ]
+        if missing:
+            parser.error("the following arguments are required: %s"
+                         % ', '.join(missing))
+
+        return args
+
     @staticmethod
-    def env_or_req(key):
+    def env_or_none(key):
         """Environment variable substitute
         Args:
             key (str): Name of environment variable to look for
         Returns:
-            string to be included in parameter parsing configuration
+            the variable's value, or None if it is unset or empty
         """
-        if os.environ.get(key):
-            result = {'default': os.environ.get(key)}
-        else:
-            result = {'required': True}
-        return result
+        value = os.environ.get(key)
+        return value if value else None
 
     def run(self):
         """Main function
         """
         self.cool_down = 0
         self.scale_up = 0
+        self.miss_count = 0
+
+        # Cycles are scheduled on fixed monotonic deadlines so that the
+        # time spent in a cycle does not push back the next one
+        deadline = time.monotonic()
 
         while True:
 
+            succeeded = False
             try:
                 self.agent_stats.reset()
 
@@ -271,11 +359,18 @@ class Autoscaler:
 
                 # Evaluate whether to auto-scale
                 self.autoscale(direction)
+                succeeded = True
 
             except Exception as e:
                 self.log.exception(e)
             finally:
-                self.timer()
+                if succeeded:
+                    self.miss_count = 0
+                    deadline += self.interval
+                else:
+                    # Back off while the app is missing or the cycle fails
+                    deadline = time.monotonic() + self.backoff()
+                deadline = self.timer(deadline)
 
 
 if __name__ == "__main__":